@@ -33,8 +33,8 @@ class AuthenticatedApi(PublicApi):
             order_id - order identifier
 
         :param pair: currency pair
-        :param quantity: quantity for the order
-        :param price: price for the order
+        :param quantity: quantity for the order (scaled int in the fixed-point numeric mode)
+        :param price: price for the order (scaled int in the fixed-point numeric mode)
         :param typ: type of order (values: buy, sell, market_buy, market_sell, market_buy_total, market_sell_total)
         :return: dict
         """
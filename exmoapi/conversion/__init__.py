@@ -0,0 +1 @@
+from exmoapi.conversion.graph import ConversionGraph
@@ -0,0 +1,202 @@
+import numpy as np
+
+from exmoapi.core.api import NumericMode
+
+
+class ConversionGraph(object):
+    """
+    Indexed graph of currencies where every currency pair gives two directed edges:
+    BASE -> QUOTE at `buy_price` and QUOTE -> BASE at 1 / `sell_price` of the ticker.
+
+    The structure (currency indices, edges and triangular cycles) is built once,
+    the rates are refreshed from every ticker snapshot with array operations.
+    """
+
+    def __init__(self, pairs, currencies=(), fee=0.0, precision=None, max_hops=3):
+        """
+        :param pairs: currency pairs (example: ['BTC_USD', 'XRP_BTC'])
+        :param currencies: additional currencies without pairs
+        :param fee: commission fraction charged on every conversion (example: 0.002)
+        :param precision: `Precision` of the fixed-point numeric mode if the ticker prices are scaled integers
+        :param max_hops: maximum number of conversions in a path (at least 1)
+        """
+        if max_hops < 1:
+            raise ValueError('Parameter `max_hops` must be at least 1.')
+        self._pairs = sorted(pairs)
+        split = [pair.split('_') for pair in self._pairs]
+        self._currencies = sorted(set(currencies) | {currency for pair in split for currency in pair})
+        self._index = {currency: i for i, currency in enumerate(self._currencies)}
+        self._base = np.array([self._index[base] for base, _ in split], dtype=np.intp)
+        self._quote = np.array([self._index[quote] for _, quote in split], dtype=np.intp)
+        self._fee = fee
+        self._precision = precision
+        self._max_hops = max_hops
+
+        n = len(self._currencies)
+        if precision is not None:
+            self._price_units = np.array([10.0 ** precision.scale(quote) for _, quote in split])
+            self._amount_units = np.array([10.0 ** precision.scale(currency) for currency in self._currencies])
+        else:
+            self._price_units = np.ones(len(self._pairs))
+            self._amount_units = np.ones(n)
+
+        adjacency = np.zeros((n, n), dtype=bool)
+        adjacency[self._base, self._quote] = True
+        adjacency[self._quote, self._base] = True
+        # a -> b -> c -> a, every cycle is kept once per direction starting from its smallest index
+        a, b, c = np.nonzero(adjacency[:, :, None] & adjacency[None, :, :] & adjacency.T[:, None, :])
+        first = (a < b) & (a < c)
+        self._cycles = np.stack((a[first], b[first], c[first]), axis=-1)
+
+        self._rates = np.eye(n)
+        self._best = None
+        self._predecessors = None
+
+    @classmethod
+    def from_api(cls, api, fee=0.0, max_hops=3):
+        """
+        Building the graph from the `pair_settings` and `currency` of the API.
+
+        In the fixed-point numeric mode the pairs and currencies already loaded by `api.precision` are reused.
+
+        :param api: PublicApi or AuthenticatedApi
+        :param fee: commission fraction charged on every conversion
+        :param max_hops: maximum number of conversions in a path
+        :return: ConversionGraph
+        """
+        if api.numeric_mode is NumericMode.FIXED:
+            precision = api.precision
+            pairs = precision.pairs or api.pair_settings().keys()
+            return cls(pairs, precision.scales.keys(), fee=fee, precision=precision, max_hops=max_hops)
+        return cls(api.pair_settings().keys(), api.currency(), fee=fee, max_hops=max_hops)
+
+    @property
+    def currencies(self):
+        return list(self._currencies)
+
+    @property
+    def pairs(self):
+        return list(self._pairs)
+
+    def update(self, ticker):
+        """
+        Refreshing the edge rates from a ticker snapshot. Pairs missing in the ticker have no edges.
+
+        :param ticker: dict as returned by `ticker`
+        :return: self
+        """
+        empty = {}
+        prices = np.array([[ticker.get(pair, empty).get('buy_price', 0), ticker.get(pair, empty).get('sell_price', 0)]
+                           for pair in self._pairs], dtype=float).reshape(-1, 2)
+        prices /= self._price_units[:, None]
+        bid, ask = prices[:, 0], prices[:, 1]
+        with np.errstate(divide='ignore'):
+            inverse_ask = np.where(ask > 0, 1.0 / ask, 0.0)
+
+        self._rates = np.eye(len(self._currencies))
+        self._rates[self._base, self._quote] = bid * (1.0 - self._fee)
+        self._rates[self._quote, self._base] = inverse_ask * (1.0 - self._fee)
+        self._best = None
+        self._predecessors = None
+        return self
+
+    def rates(self):
+        """
+        Best conversion rates between all currencies using at most `max_hops` conversions.
+
+        Only paths that never revisit a currency are considered, so arbitrage cycles are not folded
+        into the rates and a currency always converts to itself at 1.
+        rates()[i, j] is the amount of currencies[j] received for a unit of currencies[i], 0 if there is no path.
+        :return: numpy.ndarray of shape (n, n)
+        """
+        if self._best is None:
+            n = len(self._currencies)
+            eye = np.eye(n, dtype=bool)
+            edges = np.where(eye, 0.0, self._rates)
+            best = np.where(eye, 1.0, edges)
+            # visited[i, j, c] - the best path from i to j goes through c
+            visited = eye[:, None, :] | ((best > 0)[:, :, None] & eye[None, :, :])
+            predecessors = []
+            for _ in range(self._max_hops - 1):
+                # best[i, k] * edges[k, j] for every intermediate currency k not yet holding j on its path
+                candidates = best[:, :, None] * edges[None, :, :]
+                candidates[visited] = 0.0
+                via = candidates.argmax(axis=1)
+                extended = np.take_along_axis(candidates, via[:, None, :], axis=1)[:, 0, :]
+                stay = best >= extended
+                predecessors.append(np.where(stay, np.arange(n)[None, :], via))
+                best = np.where(stay, best, extended)
+                visited = np.where(stay[:, :, None], visited,
+                                   np.take_along_axis(visited, via[:, :, None], axis=1) | eye[None, :, :])
+            self._best = best
+            self._predecessors = predecessors
+        return self._best
+
+    def rate(self, source, target):
+        """
+        Best conversion rate from one currency to another.
+
+        :param source: currency to sell (example: XRP)
+        :param target: currency to buy (example: USD)
+        :return: float
+        """
+        return float(self.rates()[self._index[source], self._index[target]])
+
+    def convert(self, amounts, sources, targets):
+        """
+        Batched conversion of amounts at the best rates.
+
+        :param amounts: amounts of the source currencies
+        :param sources: currencies to sell
+        :param targets: currencies to buy
+        :return: numpy.ndarray of converted amounts
+        """
+        sources = np.array([self._index[currency] for currency in np.atleast_1d(sources)], dtype=np.intp)
+        targets = np.array([self._index[currency] for currency in np.atleast_1d(targets)], dtype=np.intp)
+        amounts = np.asarray(amounts, dtype=float) / self._amount_units[sources]
+        return amounts * self.rates()[sources, targets]
+
+    def valuate(self, balances, target='USD'):
+        """
+        Value of every balance in the target currency.
+
+        :param balances: dict of currency -> amount (example: `balances` of `user_info`)
+        :param target: currency of the valuation
+        :return: dict of currency -> value
+        """
+        currencies = [currency for currency in balances if currency in self._index]
+        values = self.convert([balances[currency] for currency in currencies], currencies, target)
+        return dict(zip(currencies, values.tolist()))
+
+    def path(self, source, target):
+        """
+        Currencies of the best conversion path, both ends included. Empty if there is no path.
+
+        :param source: currency to sell
+        :param target: currency to buy
+        :return: list
+        """
+        i, j = self._index[source], self._index[target]
+        if not self.rates()[i, j]:
+            return []
+        path = [j]
+        for predecessors in reversed(self._predecessors):
+            k = predecessors[i, path[-1]]
+            if k != path[-1]:
+                path.append(k)
+        if path[-1] != i:
+            path.append(i)
+        return [self._currencies[k] for k in reversed(path)]
+
+    def triangles(self, threshold=1.0):
+        """
+        Triangular cycles a -> b -> c -> a whose rate product exceeds the threshold, the most profitable first.
+
+        :param threshold: minimum rate product (default: 1.0, i.e. any profit)
+        :return: list of ((a, b, c), rate)
+        """
+        a, b, c = self._cycles.T
+        products = self._rates[a, b] * self._rates[b, c] * self._rates[c, a]
+        selected = np.nonzero(products > threshold)[0]
+        selected = selected[np.argsort(-products[selected], kind='stable')]
+        return [(tuple(self._currencies[k] for k in self._cycles[i]), float(products[i])) for i in selected]
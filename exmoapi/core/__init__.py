@@ -1 +1,2 @@
-from exmoapi.core.api import CoreApi, Credential
+from exmoapi.core.api import CoreApi, Credential, NumericMode
+from exmoapi.core.fixedpoint import Precision
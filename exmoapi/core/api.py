@@ -6,9 +6,15 @@ from enum import Enum
 import requests
 from requests.models import urlencode
 
+from exmoapi.core.fixedpoint import Precision
 from exmoapi.core.utils import recursive_transform
 
 
+class NumericMode(Enum):
+    FLOAT = 'float'  # prices, quantities and amounts are float
+    FIXED = 'fixed'  # prices, quantities and amounts are int scaled by the currency precision
+
+
 class Credential(object):
     def __init__(self, api_key, api_secret):
         self._key = api_key
@@ -34,7 +40,9 @@ class CoreApi(object):
                  api_version='v1',
                  headers=(),
                  proxies=(),
-                 connection_attempts=5):
+                 connection_attempts=5,
+                 numeric_mode=NumericMode.FLOAT,
+                 precision=None):
         self._API_KEY = api_key
         self._API_SECRET = bytes(api_secret or '', encoding='utf-8')
         self._API_URL = api_url
@@ -45,6 +53,29 @@ class CoreApi(object):
         self._connection_attempts = CoreApi.MAX_CONNECTION_ATTEMPTS
         self.connection_attempts = connection_attempts
         self._last_nonce = 0
+        self._numeric_mode = NumericMode(numeric_mode)
+        self._precision = precision
+
+    @property
+    def numeric_mode(self):
+        return self._numeric_mode
+
+    @property
+    def precision(self):
+        """
+        Per-currency scales of the fixed-point numeric mode.
+
+        Loaded from `pair_settings` and `currency` on first use unless passed to the constructor.
+        A price, quantity or amount with more fractional digits than its currency scale raises ValueError,
+        pass a `Precision` with larger scales to the constructor if the inferred ones are not enough.
+        The derived ticker statistics (`avg`, `vol`, `vol_curr`) are not scaled and stay float.
+        :return: Precision
+        """
+        if self._precision is None:
+            pair_settings = self._fetch('pair_settings', {}, 'post')
+            currencies = self._fetch('currency', {}, 'post')
+            self._precision = Precision.from_pair_settings(pair_settings, currencies)
+        return self._precision
 
     @property
     def connection_attempts(self):
@@ -71,6 +102,9 @@ class CoreApi(object):
         - Key is a public API key,
         - Sign is a cryptographic signature based on a hash of all parameters and public key.
 
+        In the fixed-point numeric mode int prices, quantities and amounts in the parameters
+        are sent as exact decimal strings, and the response uses scaled integers for them.
+
         :param api_endpoint: API endpoint
         :param params: query parameters
         :param http_method: request method (GET or POST).
@@ -80,8 +114,14 @@ class CoreApi(object):
         if http_method not in ('get', 'post'):
             raise ValueError("Parameter `http_method` must be 'get' or 'post' (default: 'post').")
 
-        url = f'{self._API_URL}/{self._API_VERSION}/{api_endpoint}'
         params = params or {}
+        if self._numeric_mode is NumericMode.FIXED:
+            obj = self._fetch(api_endpoint, self.precision.serialize_params(params), http_method)
+            return self.precision.transform(obj, params.get('pair'))
+        return recursive_transform(self._fetch(api_endpoint, params, http_method))
+
+    def _fetch(self, api_endpoint, params, http_method):
+        url = f'{self._API_URL}/{self._API_VERSION}/{api_endpoint}'
         headers = dict(self._headers)
 
         response = None
@@ -108,7 +148,7 @@ class CoreApi(object):
                 err = obj.get('error')
                 if err:
                     raise Exception(err)
-            return recursive_transform(obj)
+            return obj
         except Exception as e:
             raise e
 
@@ -0,0 +1,292 @@
+from decimal import Decimal
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the array helpers
+    np = None
+
+from exmoapi.core.utils import recursive_transform
+
+DEFAULT_PRECISION = 8
+
+PRICE_FIELDS = frozenset(('price', 'buy_price', 'sell_price', 'last_trade', 'high', 'low',
+                          'ask_top', 'bid_top', 'min_price', 'max_price', 'avg_price'))
+QUANTITY_FIELDS = frozenset(('quantity', 'ask_quantity', 'bid_quantity', 'min_quantity', 'max_quantity'))
+AMOUNT_FIELDS = frozenset(('amount', 'ask_amount', 'bid_amount', 'min_amount', 'max_amount'))
+# 24h statistics of the ticker are derived values with unbounded digits, they stay float.
+STATISTIC_FIELDS = frozenset(('avg', 'vol', 'vol_curr'))
+BOOK_FIELDS = frozenset(('ask', 'bid'))
+BALANCE_FIELDS = frozenset(('balances', 'reserved'))
+
+# Column order of the arrays built for order book levels and trades.
+PRICE, QUANTITY, AMOUNT = 0, 1, 2
+
+
+def decimals(value):
+    """
+    Number of significant fractional digits in a decimal value.
+
+    :param value: decimal string or number
+    :return: int
+    """
+    if isinstance(value, bool):
+        return 0
+    _, _, frac = str(value).partition('.')
+    return len(frac.rstrip('0'))
+
+
+def to_fixed(value, scale):
+    """
+    Converting a decimal value to an integer scaled by 10 ** scale without going through float.
+
+    Integers are treated as whole units, floats are taken by their shortest repr (0.1 is '0.1'),
+    None and empty strings are returned as is.
+    The conversion is exact or fails: a value with more than `scale` significant fractional digits
+    raises ValueError instead of being rounded (use a `Precision` with larger scales for such values).
+
+    :param value: decimal string, int or float
+    :param scale: number of fractional digits kept
+    :return: int
+    """
+    if value is None or value == '':
+        return value
+    if isinstance(value, bool):
+        raise TypeError('A boolean is not a decimal value.')
+    if isinstance(value, int):
+        return value * 10 ** scale
+    if isinstance(value, float):
+        value = repr(value)
+    text = value.strip()
+    if 'e' in text or 'E' in text:
+        text = format(Decimal(text), 'f')
+    sign = -1 if text.startswith('-') else 1
+    head, _, frac = text.lstrip('+-').partition('.')
+    frac = frac.rstrip('0')
+    if len(frac) > scale:
+        raise ValueError(f'The value `{value}` has more than {scale} fractional digits.')
+    return sign * (int(head or '0') * 10 ** scale + int(frac.ljust(scale, '0') or '0'))
+
+
+def from_fixed(value, scale):
+    """
+    Converting a scaled integer back to its exact decimal string.
+
+    :param value: int scaled by 10 ** scale
+    :param scale: number of fractional digits
+    :return: str
+    """
+    sign = '-' if value < 0 else ''
+    units, frac = divmod(abs(int(value)), 10 ** scale)
+    if not scale or not frac:
+        return f'{sign}{units}'
+    return f'{sign}{units}.{frac:0{scale}d}'.rstrip('0')
+
+
+def to_fixed_array(values, scale):
+    """
+    Vectorized `to_fixed`: converting a sequence of decimal values to an int64 array.
+
+    Values are parsed the same way as by `to_fixed`, exponents included.
+    Raises OverflowError if a scaled value does not fit into int64.
+
+    :param values: sequence or array of decimal strings, ints or floats
+    :param scale: number of fractional digits kept
+    :return: numpy.ndarray of int64
+    """
+    if np is None:
+        raise ImportError('numpy is required for the fixed-point array helpers.')
+    unit = 10 ** scale
+    limit = np.iinfo(np.int64).max // unit  # the largest number of whole units that fits
+    arr = np.asarray(values)
+    if not arr.size:
+        return np.zeros(arr.shape, dtype=np.int64)
+    if arr.dtype.kind in 'iu':
+        if np.any(arr > limit) or np.any(arr < -limit):
+            raise OverflowError(f'Some values do not fit into int64 at scale {scale}.')
+        return arr.astype(np.int64) * unit
+    # floats are parsed from their shortest repr, like the strings
+    arr = np.char.strip(arr.astype(str))
+    exponent = np.char.find(np.char.lower(arr), 'e') >= 0
+    if np.any(exponent):
+        arr = np.array([format(Decimal(text), 'f') if e else text
+                        for text, e in zip(arr.ravel().tolist(), exponent.ravel().tolist())]).reshape(arr.shape)
+    negative = np.char.startswith(arr, '-')
+    parts = np.char.partition(np.char.lstrip(arr, '+-'), '.')
+    head, frac = parts[..., 0], np.char.rstrip(parts[..., 2], '0')
+    if np.any(np.char.str_len(frac) > scale):
+        raise ValueError(f'Some values have more than {scale} fractional digits.')
+    frac = np.char.ljust(frac, scale, '0') if scale else np.zeros_like(frac)
+    frac = np.where(frac == '', '0', frac)
+    # the whole part is compared as a digit string, it may not even fit into int64 by itself
+    head = np.char.lstrip(head, '0')
+    head_len, limit_len = np.char.str_len(head), len(str(limit))
+    if np.any(head_len > limit_len) or np.any((head_len == limit_len) & (head >= str(limit))):
+        raise OverflowError(f'Some values do not fit into int64 at scale {scale}.')
+    head = np.where(head == '', '0', head)
+    result = head.astype(np.int64) * unit + frac.astype(np.int64)
+    return np.where(negative, -result, result)
+
+
+class Precision(object):
+    """
+    Per-currency fixed-point scales used to represent prices, quantities and amounts as integers.
+
+    A currency's scale is the largest number of fractional digits found for it in `pair_settings`
+    (`price_precision` included), but never less than DEFAULT_PRECISION.
+    """
+
+    def __init__(self, scales=None, default=DEFAULT_PRECISION, pairs=()):
+        self._scales = dict(scales or {})
+        self._default = default
+        self._pairs = list(pairs)
+
+    @classmethod
+    def from_pair_settings(cls, pair_settings, currencies=(), default=DEFAULT_PRECISION):
+        """
+        Building the scales from the raw (untransformed) `pair_settings` and `currency` responses.
+
+        :param pair_settings: dict as returned by the `pair_settings` endpoint
+        :param currencies: list as returned by the `currency` endpoint
+        :param default: minimal scale of every currency
+        :return: Precision
+        """
+        scales = {currency: default for currency in currencies}
+        for pair, settings in pair_settings.items():
+            base, quote = pair.split('_')
+            base_digits = max(decimals(settings.get(field, 0)) for field in ('min_quantity', 'max_quantity'))
+            quote_digits = max(decimals(settings.get(field, 0))
+                               for field in ('min_price', 'max_price', 'min_amount', 'max_amount'))
+            quote_digits = max(quote_digits, int(settings.get('price_precision', 0)))
+            scales[base] = max(scales.get(base, default), base_digits)
+            scales[quote] = max(scales.get(quote, default), quote_digits)
+        return cls(scales, default=default, pairs=pair_settings.keys())
+
+    @property
+    def scales(self):
+        return dict(self._scales)
+
+    @property
+    def pairs(self):
+        return list(self._pairs)
+
+    def scale(self, currency):
+        return self._scales.get(currency, self._default)
+
+    def to_fixed(self, value, currency):
+        return to_fixed(value, self.scale(currency))
+
+    def from_fixed(self, value, currency):
+        return from_fixed(value, self.scale(currency))
+
+    @staticmethod
+    def split_pair(pair):
+        """
+        Base and quote currencies of a single currency pair, or (None, None) if there is no such pair.
+
+        :param pair: currency pair (example: BTC_USD)
+        :return: tuple
+        """
+        if isinstance(pair, str) and pair.count('_') == 1 and ',' not in pair:
+            base, quote = pair.upper().split('_')
+            return base, quote
+        return None, None
+
+    def transform(self, obj, pair=None):
+        """
+        Recursive converting a raw response to use scaled integers for prices, quantities and amounts.
+
+        Prices and amounts are scaled by the quote currency of the pair, quantities by the base currency,
+        `amount` and `<name>_amount` fields accompanied by a `currency` or `<name>_currency` field
+        by that currency.
+        The pair is taken from the enclosing dict key, from the `pair` field or from the `pair` argument.
+        All other fields, the ticker statistics `avg`, `vol` and `vol_curr` included,
+        are converted with `recursive_transform`.
+
+        :param obj: json object
+        :param pair: currency pair the object belongs to
+        :return: another json object
+        """
+        if isinstance(obj, list):
+            return [self.transform(el, pair) for el in obj]
+        if not isinstance(obj, dict):
+            return recursive_transform(obj)
+
+        pair = obj.get('pair', pair)
+        base, quote = self.split_pair(pair)
+        rv = {}
+        for key, value in obj.items():
+            if key.endswith('amount') and key[:-len('amount')] + 'currency' in obj:
+                # amount, in_amount, out_amount, commission_amount are in their own currency field
+                rv[key] = self.to_fixed(value, obj[key[:-len('amount')] + 'currency'])
+            elif key in STATISTIC_FIELDS:
+                rv[key] = recursive_transform(value)
+            elif key in PRICE_FIELDS or key in AMOUNT_FIELDS:
+                rv[key] = self.to_fixed(value, quote)
+            elif key in QUANTITY_FIELDS:
+                rv[key] = self.to_fixed(value, base)
+            elif key in BOOK_FIELDS and isinstance(value, list):
+                rv[key] = [[self.to_fixed(p, quote), self.to_fixed(q, base), self.to_fixed(a, quote)]
+                           for p, q, a in value]
+            elif key in BALANCE_FIELDS and isinstance(value, dict):
+                rv[key] = {currency: self.to_fixed(v, currency) for currency, v in value.items()}
+            elif key.isupper() and self.split_pair(key) != (None, None):
+                rv[key] = self.transform(value, key)
+            else:
+                rv[key] = self.transform(value, pair)
+        return rv
+
+    def serialize_params(self, params):
+        """
+        Converting scaled integers in query parameters back to exact decimal strings.
+
+        Only int values of price, quantity and amount parameters are converted,
+        everything else is passed as is. The quantity of the `*_total` order types
+        is a total in the quote currency.
+
+        :param params: query parameters
+        :return: new dict of query parameters
+        """
+        base, quote = self.split_pair(params.get('pair'))
+        rv = dict(params)
+        for key, value in params.items():
+            if not isinstance(value, int) or isinstance(value, bool):
+                continue
+            if key in PRICE_FIELDS:
+                rv[key] = self.from_fixed(value, quote)
+            elif key in QUANTITY_FIELDS:
+                total = str(params.get('type', '')).endswith('_total')
+                rv[key] = self.from_fixed(value, quote if total else base)
+            elif key in AMOUNT_FIELDS:
+                rv[key] = self.from_fixed(value, params.get('currency', quote))
+        return rv
+
+    def order_book_array(self, levels, pair):
+        """
+        Order book levels as an int64 array with the columns PRICE, QUANTITY and AMOUNT.
+
+        :param levels: raw `ask` or `bid` list of [price, quantity, amount]
+        :param pair: currency pair
+        :return: numpy.ndarray of shape (n, 3)
+        """
+        base, quote = self.split_pair(pair)
+        columns = list(zip(*levels)) or ((), (), ())
+        return self._stack(columns, (quote, base, quote))
+
+    def trades_array(self, trades, pair):
+        """
+        Deals as an int64 array with the columns PRICE, QUANTITY and AMOUNT.
+
+        :param trades: raw list of deals of the `trades` or `user_trades` endpoint
+        :param pair: currency pair
+        :return: numpy.ndarray of shape (n, 3)
+        """
+        base, quote = self.split_pair(pair)
+        columns = [[trade[field] for trade in trades] for field in ('price', 'quantity', 'amount')]
+        return self._stack(columns, (quote, base, quote))
+
+    def _stack(self, columns, currencies):
+        if np is None:
+            raise ImportError('numpy is required for the fixed-point array helpers.')
+        arrays = [to_fixed_array(np.asarray(column, dtype=str), self.scale(currency))
+                  for column, currency in zip(columns, currencies)]
+        return np.stack(arrays, axis=-1).astype(np.int64)
@@ -58,6 +58,51 @@ class PublicApi(CoreApi):
         response = self.query('order_book', params={'pair': pairs, 'limit': limit})
         return response
 
+    def trades_arrays(self, pairs):
+        """
+        List of the deals on currency pairs as int64 arrays of scaled integers.
+
+        Every array has the columns price, quantity and amount (see `exmoapi.core.fixedpoint`),
+        scaled by the currency precision regardless of the numeric mode. Requires numpy.
+
+        :param pairs: one or various currency pairs separated by commas (example: BTC_USD,BTC_EUR)
+        :return: dict of pair -> numpy.ndarray
+        """
+        if isinstance(pairs, (list, tuple, set)):
+            pairs = ','.join(pairs)
+        if not isinstance(pairs, str):
+            raise ValueError('The `pairs` argument must be a list, tuple, set or a string.')
+        pairs = pairs.upper()
+
+        trades = self._fetch('trades', {'pair': pairs}, 'post')
+        return {pair: self.precision.trades_array(deals, pair) for pair, deals in trades.items()}
+
+    def order_book_arrays(self, pairs, limit=100):
+        """
+        The book of current orders on the currency pair as int64 arrays of scaled integers.
+
+        Fields description:
+            ask - sell orders array with the columns price, quantity and amount
+            bid - buy orders array with the columns price, quantity and amount
+
+        Values are scaled by the currency precision regardless of the numeric mode. Requires numpy.
+
+        :param limit: the number of displayed positions (default: 100, max: 1000)
+        :param pairs: one or various currency pairs separated by commas (example: BTC_USD,BTC_EUR)
+        :return: dict of pair -> dict
+        """
+        if isinstance(pairs, (list, tuple, set)):
+            pairs = ','.join(pairs)
+        if not isinstance(pairs, str):
+            raise ValueError('The `pairs` argument must be a list, tuple, set or a string.')
+        pairs = pairs.upper()
+
+        max_positions = 1000
+        limit = min(limit, max_positions)
+        response = self._fetch('order_book', {'pair': pairs, 'limit': limit}, 'post')
+        return {pair: {side: self.precision.order_book_array(book.get(side, []), pair) for side in ('ask', 'bid')}
+                for pair, book in response.items()}
+
     def ticker(self):
         """
         Statistics on prices and volume of trades by currency pairs.
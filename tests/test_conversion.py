@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `exmoapi.conversion` package."""
+
+import unittest
+from unittest import mock
+
+import tests.test_core
+from exmoapi.conversion import ConversionGraph
+from exmoapi.core import NumericMode, Precision
+from exmoapi.public import PublicApi
+
+
+class TestConversionGraph(unittest.TestCase):
+    """Tests for `exmoapi.conversion.graph` module."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.ticker = {'BTC_USD': {'buy_price': 10000.0, 'sell_price': 10000.0},
+                       'XRP_BTC': {'buy_price': 0.00005, 'sell_price': 0.00005},
+                       'XRP_USD': {'buy_price': 0.4, 'sell_price': 0.5},
+                       'USD_RUB': {'buy_price': 60.0, 'sell_price': 61.0}}
+        self.graph = ConversionGraph(self.ticker.keys(), currencies=['EUR']).update(self.ticker)
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_structure(self):
+        self.assertEqual(self.graph.currencies, ['BTC', 'EUR', 'RUB', 'USD', 'XRP'])
+        self.assertEqual(self.graph.pairs, ['BTC_USD', 'USD_RUB', 'XRP_BTC', 'XRP_USD'])
+
+    def test_best_rate(self):
+        # XRP -> BTC -> USD (0.5) is better than XRP -> USD (0.4)
+        self.assertAlmostEqual(self.graph.rate('XRP', 'USD'), 0.5)
+        self.assertEqual(self.graph.path('XRP', 'USD'), ['XRP', 'BTC', 'USD'])
+        self.assertAlmostEqual(self.graph.rate('XRP', 'RUB'), 30.0)
+        self.assertEqual(self.graph.path('XRP', 'RUB'), ['XRP', 'BTC', 'USD', 'RUB'])
+        self.assertEqual(self.graph.rate('EUR', 'USD'), 0.0)
+        self.assertEqual(self.graph.path('EUR', 'USD'), [])
+
+    def test_valuate(self):
+        values = self.graph.valuate({'BTC': 0.5, 'XRP': 1000.0, 'USD': 10.0, 'EUR': 1.0}, target='USD')
+        self.assertEqual(list(values), ['BTC', 'XRP', 'USD', 'EUR'])
+        for value, expected in zip(values.values(), (5000.0, 500.0, 10.0, 0.0)):
+            self.assertAlmostEqual(value, expected)
+
+    def test_fixed_point(self):
+        precision = Precision({'BTC': 8, 'USD': 2, 'XRP': 6, 'RUB': 2})
+        ticker = {'BTC_USD': {'buy_price': 1000000, 'sell_price': 1000000}}
+        graph = ConversionGraph(ticker.keys(), precision=precision).update(ticker)
+        self.assertAlmostEqual(graph.rate('BTC', 'USD'), 10000.0)
+        self.assertAlmostEqual(graph.valuate({'BTC': 50000000}, target='USD')['BTC'], 5000.0)
+
+    def test_triangles(self):
+        self.assertEqual(self.graph.triangles(), [])
+        ticker = dict(self.ticker, XRP_BTC={'buy_price': 0.00006, 'sell_price': 0.00006})
+        triangles = self.graph.update(ticker).triangles()
+        self.assertEqual([cycle for cycle, _ in triangles], [('BTC', 'USD', 'XRP')])
+        self.assertAlmostEqual(triangles[0][1], 10000.0 / 0.5 * 0.00006)
+        self.assertEqual(self.graph.rate('USD', 'USD'), 1.0)
+        self.assertEqual(self.graph.valuate({'USD': 10.0}, target='USD'), {'USD': 10.0})
+        self.assertEqual(self.graph.path('XRP', 'USD'), ['XRP', 'BTC', 'USD'])
+
+    def test_max_hops(self):
+        self.assertRaises(ValueError, ConversionGraph, self.ticker.keys(), max_hops=0)
+        graph = ConversionGraph(self.ticker.keys(), max_hops=1).update(self.ticker)
+        self.assertAlmostEqual(graph.rate('XRP', 'USD'), 0.4)
+        self.assertEqual(graph.rate('XRP', 'RUB'), 0.0)
+
+    def test_from_api(self):
+        responses = {'pair_settings': tests.test_core.PAIR_SETTINGS, 'currency': tests.test_core.CURRENCIES}
+        for numeric_mode in NumericMode:
+            with mock.patch('requests.request', tests.test_core.fake_request(responses)) as request:
+                api = PublicApi(numeric_mode=numeric_mode)
+                graph = ConversionGraph.from_api(api)
+            endpoints = sorted(call.args[1].rsplit('/', 1)[-1] for call in request.call_args_list)
+            self.assertEqual(endpoints, ['currency', 'pair_settings'])
+            self.assertEqual(graph.currencies, ['BTC', 'ETH', 'USD'])
+            self.assertEqual(graph.pairs, ['ETH_BTC'])
+
+    def test_arbitrage(self):
+        # BTC -> USD -> XRP -> BTC yields about 1.19 even with a fee and bid < ask on every pair
+        ticker = {'BTC_USD': {'buy_price': 10000.0, 'sell_price': 10010.0},
+                  'XRP_BTC': {'buy_price': 0.00006, 'sell_price': 0.000061},
+                  'XRP_USD': {'buy_price': 0.49, 'sell_price': 0.5}}
+        graph = ConversionGraph(ticker.keys(), fee=0.002).update(ticker)
+        self.assertGreater(graph.triangles()[0][1], 1.0)
+        for currency in graph.currencies:
+            self.assertEqual(graph.rate(currency, currency), 1.0)
+            self.assertEqual(graph.path(currency, currency), [currency])
+        self.assertEqual(graph.valuate({'USD': 10.0}, target='USD'), {'USD': 10.0})
+        for source in graph.currencies:
+            for target in graph.currencies:
+                path = graph.path(source, target)
+                self.assertEqual(len(path), len(set(path)))
+        self.assertAlmostEqual(graph.rate('USD', 'BTC'), 1 / 0.5 * 0.00006 * 0.998 ** 2)
+        self.assertEqual(graph.path('USD', 'BTC'), ['USD', 'XRP', 'BTC'])
+
+    def test_crossed_pair(self):
+        ticker = {'A_B': {'buy_price': 2.0, 'sell_price': 1.0}, 'B_C': {'buy_price': 1.0, 'sell_price': 1.0}}
+        graph = ConversionGraph(ticker.keys(), max_hops=4).update(ticker)
+        self.assertEqual(graph.rate('A', 'C'), 2.0)
+        self.assertEqual(graph.path('A', 'C'), ['A', 'B', 'C'])
+        self.assertEqual(graph.rate('A', 'A'), 1.0)
+
+    def test_fixed_point_api_ticker(self):
+        responses = {'pair_settings': tests.test_core.PAIR_SETTINGS, 'currency': tests.test_core.CURRENCIES,
+                     'ticker': {'ETH_BTC': {'buy_price': '0.031', 'sell_price': '0.032', 'avg': '0.031234567891',
+                                            'vol': '1.5', 'vol_curr': '0.0468518518365', 'updated': 1500000000}}}
+        with mock.patch('requests.request', tests.test_core.fake_request(responses)):
+            api = PublicApi(numeric_mode=NumericMode.FIXED)
+            graph = ConversionGraph.from_api(api).update(api.ticker())
+        self.assertAlmostEqual(graph.rate('ETH', 'BTC'), 0.031)
@@ -3,9 +3,14 @@
 
 """Tests for `exmoapi.core` package."""
 
+import hashlib
+import hmac
 import unittest
+from unittest import mock
+from urllib.parse import urlencode
 
-from exmoapi.core import CoreApi
+from exmoapi.core import CoreApi, NumericMode, Precision
+from exmoapi.core.fixedpoint import from_fixed, to_fixed, to_fixed_array
 
 
 class TestCoreApi(unittest.TestCase):
@@ -30,3 +35,171 @@ class TestCoreApi(unittest.TestCase):
         api = CoreApi()
         ok = api.ping()
         self.assertTrue(ok, True)
+
+
+class TestFixedPoint(unittest.TestCase):
+    """Tests for `exmoapi.core.fixedpoint` module."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        pair_settings = {'BTC_USD': {'min_quantity': '0.0001', 'max_quantity': '1000', 'min_price': '1',
+                                     'max_price': '30000', 'min_amount': '1', 'max_amount': '500000'},
+                         'ETH_BTC': {'min_quantity': '0.000000000001', 'max_quantity': '1000',
+                                     'min_price': '0.00000001', 'max_price': '1', 'min_amount': '0.0001',
+                                     'max_amount': '100'}}
+        self.precision = Precision.from_pair_settings(pair_settings, ['BTC', 'ETH', 'USD', 'RUB'])
+
+    def test_scales(self):
+        self.assertEqual(self.precision.scales, {'BTC': 8, 'ETH': 12, 'USD': 8, 'RUB': 8})
+        self.assertEqual(self.precision.scale('XRP'), 8)
+
+    def test_round_trip(self):
+        for value in ('0.00000001', '123.45', '-7', '0', '20999999.99999999'):
+            fixed = to_fixed(value, 8)
+            self.assertIsInstance(fixed, int)
+            self.assertEqual(from_fixed(fixed, 8), value)
+        self.assertEqual(to_fixed('0.1', 8) + to_fixed('0.2', 8), to_fixed('0.3', 8))
+        self.assertRaises(ValueError, to_fixed, '0.000000001', 8)
+
+    def test_transform(self):
+        response = {'BTC_USD': {'ask_top': '8000.5', 'ask_quantity': '1.00000001',
+                                'ask': [['8000.5', '0.5', '4000.25']], 'bid': []}}
+        book = self.precision.transform(response)['BTC_USD']
+        self.assertEqual(book['ask_top'], 800050000000)
+        self.assertEqual(book['ask_quantity'], 100000001)
+        self.assertEqual(book['ask'], [[800050000000, 50000000, 400025000000]])
+
+        info = self.precision.transform({'uid': '1', 'balances': {'ETH': '0.5', 'USD': '10'}})
+        self.assertEqual(info, {'uid': 1, 'balances': {'ETH': 500000000000, 'USD': 1000000000}})
+
+    def test_serialize_params(self):
+        params = {'pair': 'ETH_BTC', 'quantity': 1500000000000, 'price': 3100000, 'type': 'buy', 'limit': 100}
+        serialized = self.precision.serialize_params(params)
+        self.assertEqual(serialized, {'pair': 'ETH_BTC', 'quantity': '1.5', 'price': '0.031', 'type': 'buy',
+                                      'limit': 100})
+
+    def test_order_book_array(self):
+        levels = [['8000.5', '0.5', '4000.25'], ['7999', '0.00000001', '0.00007999']]
+        book = self.precision.order_book_array(levels, 'BTC_USD')
+        self.assertEqual(book.dtype.name, 'int64')
+        self.assertEqual(book.tolist(), [[to_fixed(value, 8) for value in level] for level in levels])
+        self.assertEqual(self.precision.order_book_array([], 'BTC_USD').shape, (0, 3))
+
+    def test_serialize_params_total(self):
+        for typ in ('market_buy_total', 'market_sell_total'):
+            params = {'pair': 'ETH_BTC', 'quantity': 100000000, 'type': typ}
+            self.assertEqual(self.precision.serialize_params(params)['quantity'], '1')
+        params = {'pair': 'ETH_BTC', 'quantity': 100000000, 'type': 'market_buy'}
+        self.assertEqual(self.precision.serialize_params(params)['quantity'], '0.0001')
+
+    def test_to_fixed_array_exponent(self):
+        values = ['1e-5', '2.5E+3', '0.1', '-3e-8']
+        self.assertEqual(to_fixed_array(values, 8).tolist(), [to_fixed(value, 8) for value in values])
+        self.assertEqual(to_fixed_array([1e-5, 0.1, 2.5], 8).tolist(), [1000, 10000000, 250000000])
+        book = self.precision.order_book_array([[1e-5, 1, 2]], 'BTC_USD')
+        self.assertEqual(book.tolist(), [[1000, 100000000, 200000000]])
+        self.assertRaises(ValueError, to_fixed_array, ['1e-9'], 8)
+
+    def test_to_fixed_array_overflow(self):
+        values = ['92233720367.5', '-1.5', '00000000000000000000000001']
+        self.assertEqual(to_fixed_array(values, 8).tolist(), [9223372036750000000, -150000000, 100000000])
+        for values in (['200000000000'], ['-200000000000'], [200000000000], [2e11]):
+            self.assertRaises(OverflowError, to_fixed_array, values, 8)
+
+    def test_transform_commission(self):
+        response = {'ETH_BTC': [{'trade_id': 3, 'pair': 'ETH_BTC', 'quantity': '1', 'price': '0.031',
+                                 'amount': '0.031', 'commission_amount': '0.000000000002',
+                                 'commission_currency': 'ETH', 'commission_percent': '0.2'}]}
+        deal = self.precision.transform(response)['ETH_BTC'][0]
+        self.assertEqual(deal['commission_amount'], 2)
+        self.assertEqual(deal['amount'], 3100000)
+        self.assertEqual(deal['commission_currency'], 'ETH')
+
+        order = self.precision.transform({'in_currency': 'BTC', 'in_amount': '0.031',
+                                          'out_currency': 'ETH', 'out_amount': '1'})
+        self.assertEqual((order['in_amount'], order['out_amount']), (3100000, 1000000000000))
+
+    def test_transform_currency_amount(self):
+        record = {'dt': 1500000000, 'type': 'deposit', 'currency': 'ETH', 'amount': '0.000000000001'}
+        self.assertEqual(self.precision.transform(record)['amount'], 1)
+        record = {'pair': 'ETH_BTC', 'currency': 'ETH', 'amount': '2'}
+        self.assertEqual(self.precision.transform(record)['amount'], 2000000000000)
+        params = self.precision.serialize_params({'currency': 'ETH', 'amount': 1})
+        self.assertEqual(self.precision.transform(params)['amount'], 1)
+
+    def test_to_fixed_edge_values(self):
+        self.assertIsNone(to_fixed(None, 8))
+        self.assertEqual(to_fixed('', 8), '')
+        self.assertEqual(to_fixed('1e-5', 8), 1000)
+        self.assertEqual(to_fixed('-2.5E+3', 2), -250000)
+        self.assertEqual(to_fixed(0.1, 8), 10000000)
+        self.assertEqual(to_fixed(1e-5, 8), to_fixed_array([1e-5], 8)[0])
+        # strict on purpose: more digits than the scale is an error, not a rounding
+        self.assertRaises(ValueError, to_fixed, 1e-9, 8)
+        self.assertRaises(ValueError, to_fixed, '8016.639586111', 8)
+        precision = Precision({'USD': 10})
+        self.assertEqual(precision.transform({'BTC_USD': {'last_trade': '8016.639586111', 'updated': None}}),
+                         {'BTC_USD': {'last_trade': 80166395861110, 'updated': None}})
+
+    def test_transform_ticker_statistics(self):
+        ticker = {'BTC_USD': {'buy_price': '8016.5', 'sell_price': '8017', 'avg': '8016.639586111',
+                              'vol': '12.1234567891', 'vol_curr': '97190.123456789', 'updated': 1500000000}}
+        row = self.precision.transform(ticker)['BTC_USD']
+        self.assertEqual((row['buy_price'], row['sell_price']), (801650000000, 801700000000))
+        self.assertEqual((row['avg'], row['vol'], row['vol_curr']), (8016.639586111, 12.1234567891, 97190.123456789))
+
+
+PAIR_SETTINGS = {'ETH_BTC': {'min_quantity': '0.000000000001', 'max_quantity': '1000', 'min_price': '0.00000001',
+                             'max_price': '1', 'min_amount': '0.0001', 'max_amount': '100'}}
+CURRENCIES = ['BTC', 'ETH', 'USD']
+
+
+def fake_request(responses):
+    """Replacement of `requests.request` answering with the JSON of the requested endpoint."""
+    def request(http_method, url, data=None, headers=None, proxies=None):
+        response = mock.Mock()
+        response.json.return_value = responses[url.rsplit('/', 1)[-1]]
+        return response
+    return mock.Mock(side_effect=request)
+
+
+class TestFixedPointApi(unittest.TestCase):
+    """Tests for the fixed-point numeric mode of `exmoapi.core.api` module."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.responses = {'pair_settings': PAIR_SETTINGS, 'currency': CURRENCIES,
+                          'order_create': {'result': True, 'error': '', 'order_id': '123'},
+                          'required_amount': {'quantity': '3', 'amount': '0.093', 'avg_price': '0.031'}}
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_lazy_precision(self):
+        with mock.patch('requests.request', fake_request(self.responses)) as request:
+            api = CoreApi(numeric_mode='fixed')
+            self.assertIs(api.numeric_mode, NumericMode.FIXED)
+            self.assertEqual(api.precision.scales, {'BTC': 8, 'ETH': 12, 'USD': 8})
+            self.assertEqual(api.precision.scales, {'BTC': 8, 'ETH': 12, 'USD': 8})
+        endpoints = [call.args[1].rsplit('/', 1)[-1] for call in request.call_args_list]
+        self.assertEqual(endpoints, ['pair_settings', 'currency'])
+
+    def test_query(self):
+        with mock.patch('requests.request', fake_request(self.responses)):
+            api = CoreApi(numeric_mode=NumericMode.FIXED)
+            amount = api.query('required_amount', params={'pair': 'ETH_BTC', 'quantity': 3000000000000})
+        self.assertEqual(amount, {'quantity': 3000000000000, 'amount': 9300000, 'avg_price': 3100000})
+
+    def test_signed_query(self):
+        with mock.patch('requests.request', fake_request(self.responses)) as request:
+            api = CoreApi(api_key='K', api_secret='S', numeric_mode=NumericMode.FIXED)
+            params = {'pair': 'ETH_BTC', 'quantity': 1500000000000, 'price': 3100000, 'type': 'buy'}
+            order = api.query('order_create', params=params)
+        self.assertEqual(order['order_id'], 123)
+
+        _, kwargs = request.call_args
+        sent, headers = kwargs['data'], kwargs['headers']
+        self.assertEqual((sent['quantity'], sent['price']), ('1.5', '0.031'))
+        sign = hmac.new(key=b'S', msg=urlencode(sent).encode('utf-8'), digestmod=hashlib.sha512).hexdigest()
+        self.assertEqual(headers['Sign'], sign)
+        self.assertEqual(params['quantity'], 1500000000000)
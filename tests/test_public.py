@@ -4,7 +4,10 @@
 """Tests for `exmoapi.public` package."""
 
 import unittest
+from unittest import mock
 
+import tests.test_core
+from exmoapi.core import Precision
 from exmoapi.public import PublicApi
 
 
@@ -58,3 +61,29 @@ class TestPublicApi(unittest.TestCase):
 
         currencies = {currency for pair in self.pairs for currency in pair.split('_')}
         self.assertTrue(currencies.issubset(all_currencies))
+
+
+class TestPublicApiArrays(unittest.TestCase):
+    """Tests for the array queries of `exmoapi.public.api` module."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.responses = {
+            'order_book': {'ETH_BTC': {'ask_top': '0.031', 'ask': [['0.031', '1.5', '0.0465']], 'bid': []}},
+            'trades': {'ETH_BTC': [{'trade_id': 1, 'type': 'buy', 'price': '0.031', 'quantity': '2',
+                                    'amount': '0.062', 'date': 1500000000}]}}
+        self.api = PublicApi(precision=Precision({'BTC': 8, 'ETH': 12}))
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_order_book_arrays(self):
+        with mock.patch('requests.request', tests.test_core.fake_request(self.responses)):
+            books = self.api.order_book_arrays('eth_btc')
+        self.assertEqual(books['ETH_BTC']['ask'].tolist(), [[3100000, 1500000000000, 4650000]])
+        self.assertEqual(books['ETH_BTC']['bid'].shape, (0, 3))
+
+    def test_trades_arrays(self):
+        with mock.patch('requests.request', tests.test_core.fake_request(self.responses)):
+            trades = self.api.trades_arrays(['ETH_BTC'])
+        self.assertEqual(trades['ETH_BTC'].tolist(), [[3100000, 2000000000000, 6200000]])